@@ -5,95 +5,480 @@ Integrates with existing iza-os-agents and orchestration systems
 """
 
 import asyncio
-import json
-from typing import Dict, List, Optional
+import contextlib
+import functools
+import os
+import random
+import sys
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
+import httpx
 import openai
+import orjson
 from pathlib import Path
 
+# Pricing by category complexity
+_PRICING = {
+    "fintech": {"individual": 49, "bundle": 299, "enterprise": 1997},
+    "saas": {"individual": 39, "bundle": 249, "enterprise": 1497},
+    "ecommerce": {"individual": 29, "bundle": 199, "enterprise": 997},
+    "consulting": {"individual": 59, "bundle": 399, "enterprise": 2497},
+    "default": {"individual": 25, "bundle": 149, "enterprise": 897}
+}
+
+# Categories with dedicated pricing; everything else falls back to "default"
+_CATEGORIES = frozenset(_PRICING) - {"default"}
+
+# Static prompt pieces, kept byte-identical across calls so the shared prefix qualifies for prompt caching
+_SYSTEM_MSG = {"role": "system", "content": "You are a business template generator creating actionable, profitable business models."}
+
+_USER_TEMPLATE = """Generate comprehensive business templates for category: {category}
+
+Each template must include:
+1. Business model overview
+2. Revenue streams (3-5 specific methods)
+3. Target market analysis
+4. Operational workflow (step-by-step)
+5. Technology stack requirements
+6. Financial projections (6-month)
+7. Marketing strategy
+8. Risk assessment
+9. Success metrics
+10. Implementation timeline
+
+Make them actionable and monetizable."""
+
+_GROUP_TEMPLATE = """
+
+Generate {count} distinct templates, numbered #{first} to #{last}, each with a business model distinct from the others for this category.
+Respond with a JSON object of the form {{"templates": [...]}} containing exactly {count} template objects."""
+
+# Shared OpenAI clients per event loop and API key, so every orchestrator on a loop reuses one keep-alive
+# connection pool; httpx connections are bound to the loop that opened them
+_OPENAI_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Optional[str], openai.AsyncOpenAI]]" = weakref.WeakKeyDictionary()
+
+def _get_openai_client(api_key: Optional[str]) -> openai.AsyncOpenAI:
+    """Return the running loop's shared AsyncOpenAI client for an API key, creating it on first use"""
+    clients = _OPENAI_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    if api_key not in clients:
+        clients[api_key] = openai.AsyncOpenAI(
+            api_key=api_key,
+            # _request_with_retries owns retries and backoff; SDK retries would multiply attempts
+            max_retries=0,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                timeout=60
+            )
+        )
+    return clients[api_key]
+
+# Number of callers on each loop currently using its shared OpenAI clients
+_OPENAI_CLIENT_USERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]" = weakref.WeakKeyDictionary()
+
+async def _close_openai_clients():
+    """Close the running loop's shared OpenAI clients and their connection pools"""
+    clients = _OPENAI_CLIENTS.pop(asyncio.get_running_loop(), {})
+    await asyncio.gather(*(client.close() for client in clients.values()))
+
+@contextlib.asynccontextmanager
+async def _openai_clients_in_use():
+    """Keep the running loop's shared OpenAI clients open while in use; the last user out closes them"""
+    loop = asyncio.get_running_loop()
+    _OPENAI_CLIENT_USERS[loop] = _OPENAI_CLIENT_USERS.get(loop, 0) + 1
+    try:
+        yield
+    finally:
+        _OPENAI_CLIENT_USERS[loop] -= 1
+        if not _OPENAI_CLIENT_USERS[loop]:
+            del _OPENAI_CLIENT_USERS[loop]
+            await _close_openai_clients()
+
+async def _gather_or_cancel(*aws) -> List:
+    """Gather awaitables as tasks; if one fails or the caller is cancelled, cancel the rest instead of orphaning them"""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+def _ttl_cache(ttl: float):
+    """Memoize a no-argument status coroutine per instance for ttl seconds; call .cache_clear() to invalidate
+    
+    Callers get a copy of the cached dict, so mutating a result never changes what later callers see.
+    """
+    def decorator(method):
+        cached: "weakref.WeakKeyDictionary[Any, Tuple[float, Dict]]" = weakref.WeakKeyDictionary()
+        
+        @functools.wraps(method)
+        async def wrapper(self):
+            now = time.monotonic()
+            entry = cached.get(self)
+            if entry is None or now - entry[0] >= ttl:
+                entry = cached[self] = (now, await method(self))
+            return dict(entry[1])
+        
+        wrapper.cache_clear = cached.clear
+        return wrapper
+    return decorator
+
+# OpenAI errors worth retrying: rate limits, 5xx and dropped connections
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError)
+
+class RequestRateLimiter:
+    """Paces requests evenly so a burst of concurrent calls stays under an RPM limit"""
+    
+    def __init__(self, max_rate: int, period: float = 60.0):
+        self._interval = period / max_rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait for the next free request slot"""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class TemplateCache:
+    """Semantic cache of generated template content keyed by prompt embedding"""
+    
+    def __init__(self, threshold: float = 0.92):
+        self.threshold = threshold
+        self._entries: List[Dict] = []
+    
+    def lookup(self, prompt_embedding: List[float], threshold: Optional[float] = None) -> Optional[List[str]]:
+        """Return cached responses for the closest prompt above the similarity threshold"""
+        entry = self._closest_entry(prompt_embedding, threshold or self.threshold)
+        return entry["responses"] if entry else None
+    
+    def update(self, embedding: List[float], response: str):
+        """Store a response under its prompt embedding"""
+        entry = self._closest_entry(embedding, self.threshold)
+        if entry:
+            entry["responses"].append(response)
+        else:
+            self._entries.append({"embedding": embedding, "responses": [response]})
+    
+    def _closest_entry(self, embedding: List[float], threshold: float) -> Optional[Dict]:
+        """Find the most similar cached prompt (OpenAI embeddings are unit length, so dot product is cosine)"""
+        best_entry, best_score = None, threshold
+        for entry in self._entries:
+            score = sum(a * b for a, b in zip(embedding, entry["embedding"]))
+            if score >= best_score:
+                best_entry, best_score = entry, score
+        
+        return best_entry
+
 class TemplateOrchestrator:
     """AI-powered template generation orchestrator"""
     
     def __init__(self, config: Dict):
         self.config = config
-        self.openai_client = openai.AsyncOpenAI(api_key=config.get('openai_key'))
         self.template_count = 487
         self.generated_today = 0
         
-    async def generate_template_batch(self, category: str, count: int = 10) -> List[Dict]:
-        """Generate a batch of business templates for specified category"""
-        templates = []
+        # Caps in-flight OpenAI requests so concurrent batches stay under the RPM limit
+        self._semaphore = asyncio.Semaphore(config.get('max_concurrency', 50))
+        self._rate_limiter = RequestRateLimiter(config.get('requests_per_minute', 500))
+        
+        # Opt-in semantic cache: regenerating a category reuses earlier variants instead of paying for new ones
+        self.template_cache = TemplateCache(config.get('cache_threshold', 0.92)) if config.get('semantic_cache') else None
+        
+    @property
+    def openai_client(self) -> openai.AsyncOpenAI:
+        """The running event loop's shared OpenAI client for this orchestrator's API key"""
+        return _get_openai_client(self.config.get('openai_key'))
+    
+    async def generate_template_batch(self, category: str, count: int = 10, mode: str = "concurrent") -> List[Dict]:
+        """Generate a batch of business templates for specified category
+        
+        Templates are requested in groups of templates_per_request per call.
+        mode="concurrent" fans the groups out as low-latency chat completions;
+        mode="batch" submits one OpenAI Batch API job at half the cost but up
+        to 24h turnaround.
+        """
+        groups = self._template_groups(count)
+        timestamp = self._batch_timestamp()
+        
+        if mode == "batch":
+            templates = await self._generate_via_batch_api(category, groups, timestamp)
+        else:
+            # Transient failures already come back as empty groups; anything else (auth, bad request) propagates
+            embedding = await self._category_embedding(category)
+            results = await _gather_or_cancel(*[self._generate_template_group(category, start, size, timestamp, embedding) for start, size in groups])
+            templates = [template for result in results for template in result]
         
-        for i in range(count):
-            template = await self._generate_single_template(category, i)
-            templates.append(template)
-            self.generated_today += 1
+        self.generated_today += len(templates)
             
         return templates
     
-    async def _generate_single_template(self, category: str, index: int) -> Dict:
-        """Generate a single business template using OpenAI"""
-        
-        prompt = f"""
-        Generate a comprehensive business template for category: {category}
-        
-        Include:
-        1. Business model overview
-        2. Revenue streams (3-5 specific methods)
-        3. Target market analysis
-        4. Operational workflow (step-by-step)
-        5. Technology stack requirements
-        6. Financial projections (6-month)
-        7. Marketing strategy
-        8. Risk assessment
-        9. Success metrics
-        10. Implementation timeline
-        
-        Make it actionable and monetizable. Format as structured JSON.
+    async def iter_templates(self, category: str, count: int = 10):
+        """Yield templates as soon as their group completes, so callers can deploy while generation continues"""
+        timestamp = self._batch_timestamp()
+        embedding = await self._category_embedding(category)
+        tasks = [
+            asyncio.create_task(self._generate_template_group(category, start, size, timestamp, embedding))
+            for start, size in self._template_groups(count)
+        ]
+        
+        # A failed group, or a caller that stops iterating, cancels the groups still in flight
+        try:
+            for next_group in asyncio.as_completed(tasks):
+                for template in await next_group:
+                    self.generated_today += 1
+                    yield template
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _template_groups(self, count: int) -> List[Tuple[int, int]]:
+        """Split a template count into (start, size) groups of templates_per_request"""
+        group_size = self.config.get('templates_per_request', 10)
+        return [(start, min(group_size, count - start)) for start in range(0, count, group_size)]
+    
+    def _batch_timestamp(self) -> Tuple[str, str]:
+        """Format the batch creation time once as (id date, ISO timestamp) shared by every template in the batch"""
+        now = datetime.now()
+        return now.strftime('%Y%m%d'), now.isoformat()
+    
+    async def _generate_template_group(self, category: str, start: int, count: int, timestamp: Tuple[str, str],
+                                       embedding: Optional[List[float]] = None) -> List[Dict]:
+        """Generate a group of business templates with a single OpenAI call
+        
+        embedding is the batch's category prompt embedding; without one the semantic cache is bypassed.
         """
         
-        response = await self.openai_client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You are a business template generator creating actionable, profitable business models."},
-                {"role": "user", "content": prompt}
-            ]
+        if embedding is not None:
+            cached = self.template_cache.lookup(embedding)
+            if cached and start + count <= len(cached):
+                return [self._build_template_data(category, start + i, content, timestamp) for i, content in enumerate(cached[start:start + count])]
+        
+        response = await self._create_completion(
+            model="gpt-4o",
+            messages=self._build_template_messages(category, start, count),
+            response_format={"type": "json_object"}
         )
+        if response is None:
+            return []
+        
+        choice = response.choices[0]
+        if choice.finish_reason == "length":
+            return await self._regenerate_truncated_group(category, start, count, timestamp, embedding)
+        
+        contents = self._parse_template_group(choice.message.content, count)
+        if embedding is not None:
+            for content in contents:
+                self.template_cache.update(embedding, content)
+        
+        return [self._build_template_data(category, start + i, content, timestamp) for i, content in enumerate(contents)]
+    
+    async def _regenerate_truncated_group(self, category: str, start: int, count: int, timestamp: Tuple[str, str],
+                                          embedding: Optional[List[float]] = None) -> List[Dict]:
+        """Retry a group whose response hit the token limit as two half-size groups
+        
+        A cut-off response is invalid JSON, so the whole group would otherwise be lost.
+        """
+        if count == 1:
+            print(f"⚠️ Skipping {category} template {start + 1}: response exceeded the token limit", file=sys.stderr)
+            return []
+        
+        half = count // 2
+        first, second = await _gather_or_cancel(
+            self._generate_template_group(category, start, half, timestamp, embedding),
+            self._generate_template_group(category, start + half, count - half, timestamp, embedding)
+        )
+        return first + second
+    
+    async def _create_completion(self, **kwargs):
+        """Create a chat completion through the shared retry, concurrency and rate limits"""
+        return await self._request_with_retries(lambda client: client.chat.completions.create, **kwargs)
+    
+    async def _request_with_retries(self, endpoint, max_attempts: int = 6, **kwargs):
+        """Call an OpenAI endpoint, retrying transient failures with random exponential backoff
+        
+        endpoint maps a client to the method to call; the client is looked up on every attempt.
+        Returns None once retries are exhausted so one failing request doesn't sink the batch;
+        non-transient errors such as authentication failures are raised to the caller.
+        """
+        for attempt in range(max_attempts):
+            async with self._semaphore:
+                await self._rate_limiter.acquire()
+                try:
+                    return await endpoint(self.openai_client)(**kwargs)
+                except _RETRYABLE_ERRORS:
+                    if attempt == max_attempts - 1:
+                        print(f"⚠️ Giving up on an OpenAI request after {max_attempts} attempts", file=sys.stderr)
+                        return None
+            
+            await asyncio.sleep(random.uniform(1, min(60, 2 ** (attempt + 1))))
+    
+    async def _category_embedding(self, category: str) -> Optional[List[float]]:
+        """Embed a category's prompt once per batch for semantic cache lookups, or None when caching is off
+        
+        Keyed on the category prompt only, so every group of one category shares a cache entry.
+        """
+        if not self.template_cache:
+            return None
+        
+        return await self._embed_prompt(_USER_TEMPLATE.format(category=category))
+    
+    async def _embed_prompt(self, prompt: str) -> Optional[List[float]]:
+        """Embed a prompt for semantic cache lookups; None if the request keeps failing"""
+        response = await self._request_with_retries(
+            lambda client: client.embeddings.create,
+            model="text-embedding-3-small",
+            input=prompt
+        )
+        
+        return response.data[0].embedding if response else None
+    
+    async def _generate_via_batch_api(self, category: str, groups: List[Tuple[int, int]], timestamp: Tuple[str, str]) -> List[Dict]:
+        """Generate template groups through a single OpenAI Batch API job"""
+        batch_lines = [
+            orjson.dumps({
+                "custom_id": f"{category}_{start}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "gpt-4o",
+                    "messages": self._build_template_messages(category, start, size),
+                    "response_format": {"type": "json_object"}
+                }
+            })
+            for start, size in groups
+        ]
+        
+        batch_file = await self.openai_client.files.create(
+            file=(f"{category}_templates.jsonl", b"\n".join(batch_lines)),
+            purpose="batch"
+        )
+        batch = await self.openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        
+        # Poll with exponential backoff until the job reaches a terminal state
+        delay = 5
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 300)
+            batch = await self.openai_client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed":
+            errors = "; ".join(f"{error.code}: {error.message}" for error in ((batch.errors and batch.errors.data) or []))
+            print(f"⚠️ {category} batch {batch.id} ended {batch.status}" + (f": {errors}" if errors else ""), file=sys.stderr)
+            return []
+        
+        # Every request failing leaves the job completed with only an error file
+        lines = (await self.openai_client.files.content(batch.output_file_id)).text.splitlines() if batch.output_file_id else []
+        
+        group_sizes = dict(groups)
+        results = {}
+        truncated = []
+        failures = []
+        for line in lines:
+            record = orjson.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                failures.append(record.get("error") or (response.get("body") or {}).get("error"))
+                continue
+            
+            start = int(record["custom_id"].rsplit("_", 1)[1])
+            choice = response["body"]["choices"][0]
+            if choice.get("finish_reason") == "length":
+                truncated.append(start)
+                continue
+            
+            contents = self._parse_template_group(choice["message"]["content"], group_sizes[start])
+            results[start] = [self._build_template_data(category, start + i, content, timestamp) for i, content in enumerate(contents)]
+        
+        # Groups cut off at the token limit are retried as smaller live requests rather than another 24h job
+        regenerated = await _gather_or_cancel(*[
+            self._regenerate_truncated_group(category, start, group_sizes[start], timestamp) for start in truncated
+        ])
+        results.update(zip(truncated, regenerated))
+        
+        dropped = len(groups) - len(results)
+        if dropped:
+            detail = f"; first error: {failures[0]}" if failures else f"; see error file {batch.error_file_id}" if batch.error_file_id else ""
+            print(f"⚠️ Dropped {dropped} of {len(groups)} {category} template groups from batch {batch.id}{detail}", file=sys.stderr)
+        
+        # Output order is not guaranteed; restore request order
+        return [template for start in sorted(results) for template in results[start]]
+    
+    def _build_template_messages(self, category: str, start: int, count: int) -> List[Dict]:
+        """Build the chat messages for a template group request"""
+        prompt = _USER_TEMPLATE.format(category=category) + _GROUP_TEMPLATE.format(count=count, first=start + 1, last=start + count)
+        return [_SYSTEM_MSG, {"role": "user", "content": prompt}]
+    
+    def _parse_template_group(self, content: str, count: int) -> List[str]:
+        """Split a JSON-mode group response into at most count JSON strings, one per template
+        
+        Extra templates are dropped so they can't take the indices of the next group.
+        """
+        try:
+            parsed = orjson.loads(content)
+        except orjson.JSONDecodeError as error:
+            print(f"⚠️ Skipping template group with malformed JSON: {error}", file=sys.stderr)
+            return []
+        
+        if isinstance(parsed, dict):
+            parsed = parsed.get("templates", [])
+        if not isinstance(parsed, list):
+            return []
+        
+        return [orjson.dumps(template).decode() for template in parsed[:count]]
+    
+    def _build_template_data(self, category: str, index: int, content: str, timestamp: Tuple[str, str]) -> Dict:
+        """Wrap generated template content with marketplace metadata"""
+        date_str, generated_at = timestamp
         
         template_data = {
-            "id": f"{category}_{index}_{datetime.now().strftime('%Y%m%d')}",
+            "id": f"{category}_{index}_{date_str}",
             "category": category,
-            "generated_at": datetime.now().isoformat(),
-            "content": response.choices[0].message.content,
+            "generated_at": generated_at,
+            "content": content,
             "price_tier": self._calculate_price_tier(category),
             "monetization_ready": True
         }
         
         return template_data
     
-    def _calculate_price_tier(self, category: str) -> Dict:
-        """Calculate pricing based on category complexity"""
-        pricing_tiers = {
-            "fintech": {"individual": 49, "bundle": 299, "enterprise": 1997},
-            "saas": {"individual": 39, "bundle": 249, "enterprise": 1497},
-            "ecommerce": {"individual": 29, "bundle": 199, "enterprise": 997},
-            "consulting": {"individual": 59, "bundle": 399, "enterprise": 2497},
-            "default": {"individual": 25, "bundle": 149, "enterprise": 897}
-        }
+    @staticmethod
+    def _calculate_price_tier(category: str) -> Dict:
+        """Calculate pricing based on category complexity
         
-        return pricing_tiers.get(category.lower(), pricing_tiers["default"])
+        Returns a copy so templates and deployments never alias the shared pricing table.
+        """
+        key = category.lower()
+        return dict(_PRICING[key] if key in _CATEGORIES else _PRICING["default"])
     
     async def integrate_with_iza_agents(self) -> Dict:
         """Connect with existing IZA OS agent orchestration"""
+        financial, sales, marketing, operations = await asyncio.gather(
+            self._check_financial_integration(),
+            self._check_sales_integration(),
+            self._check_marketing_integration(),
+            self._check_operations_integration()
+        )
+        
         integration_status = {
-            "financial_core": await self._check_financial_integration(),
-            "sales_core": await self._check_sales_integration(),
-            "marketing_core": await self._check_marketing_integration(),
-            "operations_core": await self._check_operations_integration(),
+            "financial_core": financial,
+            "sales_core": sales,
+            "marketing_core": marketing,
+            "operations_core": operations,
         }
         
         return integration_status
     
+    @_ttl_cache(ttl=30)
     async def _check_financial_integration(self) -> Dict:
         """Verify financial core integration for payment processing"""
         return {
@@ -103,6 +488,7 @@ class TemplateOrchestrator:
             "subscription_management": True
         }
     
+    @_ttl_cache(ttl=30)
     async def _check_sales_integration(self) -> Dict:
         """Verify sales core integration for lead tracking"""
         return {
@@ -112,6 +498,7 @@ class TemplateOrchestrator:
             "lead_scoring": True
         }
     
+    @_ttl_cache(ttl=30)
     async def _check_marketing_integration(self) -> Dict:
         """Verify marketing core integration for campaign automation"""
         return {
@@ -121,6 +508,7 @@ class TemplateOrchestrator:
             "social_media_integration": True
         }
     
+    @_ttl_cache(ttl=30)
     async def _check_operations_integration(self) -> Dict:
         """Verify operations core integration for template delivery"""
         return {
@@ -147,6 +535,23 @@ class TemplateOrchestrator:
         
         return deployment_result
     
+    async def persist_deployments(self, deployments: List[Dict]) -> Path:
+        """Append deployment records to the JSONL manifest with a single write and fsync"""
+        path = Path(self.config.get('deployments_path', 'deployments.jsonl'))
+        payload = b"".join(orjson.dumps(deployment) + b"\n" for deployment in deployments)
+        
+        await asyncio.to_thread(self._append_and_sync, path, payload)
+        
+        return path
+    
+    @staticmethod
+    def _append_and_sync(path: Path, payload: bytes):
+        """Blocking append + fsync, run off the event loop"""
+        with open(path, "ab") as manifest:
+            manifest.write(payload)
+            manifest.flush()
+            os.fsync(manifest.fileno())
+    
     async def _create_marketing_campaign(self, template: Dict):
         """Auto-create marketing campaign for new template"""
         campaign_config = {
@@ -168,11 +573,38 @@ async def warp_generate_templates(category: str, count: int = 10):
     orchestrator = TemplateOrchestrator(config)
     
     print(f"🚀 Generating {count} templates for {category}...")
-    templates = await orchestrator.generate_template_batch(category, count)
     
-    for template in templates:
-        deployment = await orchestrator.deploy_template_to_marketplace(template)
-        print(f"✅ Deployed: {deployment['marketplace_url']}")
+    # Deploy each template as soon as it is generated instead of waiting for the whole batch
+    templates = []
+    deployments = []
+    progress = []
+    results = []
+    try:
+        async with _openai_clients_in_use():
+            async with contextlib.aclosing(orchestrator.iter_templates(category, count)) as generated:
+                async for template in generated:
+                    templates.append(template)
+                    deployments.append(asyncio.create_task(orchestrator.deploy_template_to_marketplace(template)))
+        
+        # Write progress in chunks rather than one print per template
+        for deployment in asyncio.as_completed(deployments):
+            result = await deployment
+            results.append(result)
+            progress.append(f"✅ Deployed: {result['marketplace_url']}")
+            if len(progress) == 50:
+                sys.stdout.write("\n".join(progress) + "\n")
+                progress.clear()
+    finally:
+        # On failure, stop and reap the deployments still running rather than leaving them orphaned
+        for deployment in deployments:
+            deployment.cancel()
+        await asyncio.gather(*deployments, return_exceptions=True)
+    
+    if progress:
+        sys.stdout.write("\n".join(progress) + "\n")
+    
+    manifest_path = await orchestrator.persist_deployments(results)
+    print(f"📄 Deployment manifest: {manifest_path}")
     
     print(f"🎉 Generated {len(templates)} templates successfully!")
     return templates
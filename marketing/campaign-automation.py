@@ -6,12 +6,279 @@ Complete go-to-market strategy with DSPy, Klavis AI, FastMCP, Claude-Flow integr
 
 import asyncio
 import json
+from dataclasses import asdict, dataclass
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-import requests
-import subprocess
+from typing import Any, Dict, List, Optional, Tuple
+import aiohttp
 from pathlib import Path
+from types import MappingProxyType
+
+# Shared HTTP session so GitHub API calls reuse pooled connections
+_http_session: Optional[aiohttp.ClientSession] = None
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+    return _http_session
+
+async def _close_http_session():
+    """Close the shared aiohttp session"""
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+
+async def _run_git(*args: str) -> Tuple[int, str]:
+    """Run a git command without blocking the event loop, returning (returncode, stderr)
+    
+    A git binary that can't be started (e.g. not installed) is reported as a failed command.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            'git', *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except OSError as e:
+        return 127, f"{type(e).__name__}: {e}"
+    _, stderr = await proc.communicate()
+    return proc.returncode, stderr.decode(errors='replace').strip()
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _thaw(value: Any) -> Any:
+    """Return a plain, serializable copy of a frozen value: dicts for mappings and dataclasses, lists for tuples"""
+    if isinstance(value, SocialCampaign):
+        value = asdict(value)
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+@dataclass(slots=True, frozen=True)
+class SocialCampaign:
+    """Social media campaign for one platform, with numeric budget and audience targets"""
+    platform: str
+    campaign_type: str
+    themes: Tuple[str, ...]
+    schedule: str
+    budget_usd_month: int
+    target_metric: str
+    target_count: int
+    hashtags: str = ''
+    target_audience: str = ''
+
+# Campaign definitions below are shared read-only by every engine; callers get plain copies via _thaw
+
+# Social media campaigns per platform
+_SOCIAL_CAMPAIGNS = MappingProxyType({
+    'twitter': SocialCampaign(
+        platform='twitter',
+        campaign_type='product_launch',
+        themes=(
+            '487 Business Templates Launch',
+            'AI-Powered Entrepreneurship',
+            'Template Success Stories',
+            'Build Business in 24 Hours',
+            'From Idea to Revenue'
+        ),
+        schedule='3x daily',
+        hashtags='#BusinessTemplates #AIEntrepreneurship #StartupTools #IZA_OS',
+        budget_usd_month=500,
+        target_metric='followers',
+        target_count=10000
+    ),
+
+    'linkedin': SocialCampaign(
+        platform='linkedin',
+        campaign_type='b2b_lead_generation',
+        themes=(
+            'Business Automation Templates',
+            'Enterprise Template Solutions',
+            'AI-Driven Business Models',
+            'Consulting Template Packages',
+            'ROI Case Studies'
+        ),
+        schedule='1x daily',
+        target_audience='entrepreneurs, consultants, business_owners',
+        budget_usd_month=750,
+        target_metric='connections',
+        target_count=5000
+    ),
+
+    'youtube': SocialCampaign(
+        platform='youtube',
+        campaign_type='educational_content',
+        themes=(
+            'Template Walkthrough Series',
+            'Business Building Tutorials',
+            'AI Automation Demos',
+            'Success Story Interviews',
+            'Live Template Creation'
+        ),
+        schedule='2x weekly',
+        budget_usd_month=1000,
+        target_metric='subscribers',
+        target_count=25000
+    )
+})
+
+# Content marketing strategy
+_CONTENT_STRATEGY = _freeze({
+    'blog_posts': {
+        'publishing_schedule': '3x weekly',
+        'content_pillars': [
+            'Business Template Tutorials',
+            'Entrepreneurship Guides',
+            'AI Automation Tips',
+            'Revenue Generation Strategies',
+            'Template Success Stories'
+        ],
+        'target_traffic': '50K monthly visitors',
+        'seo_keywords': [
+            'business templates', 'ai business automation',
+            'startup templates', 'business model canvas',
+            'revenue generation templates'
+        ]
+    },
+
+    'email_newsletter': {
+        'frequency': 'weekly',
+        'segments': [
+            'template_buyers', 'free_users', 'enterprise_prospects',
+            'content_subscribers', 'affiliate_partners'
+        ],
+        'target_subscribers': 50000,
+        'conversion_goal': '5% template sales from email'
+    },
+
+    'resource_library': {
+        'free_templates': 25,  # Lead magnets
+        'case_studies': 50,
+        'tutorial_videos': 100,
+        'business_guides': 20,
+        'roi_calculators': 10
+    }
+})
+
+# Community outreach strategy
+_COMMUNITY_STRATEGY = _freeze({
+    'reddit_campaigns': {
+        'target_subreddits': [
+            'r/entrepreneur', 'r/startups', 'r/smallbusiness',
+            'r/business', 'r/SaaS', 'r/marketing', 'r/passive_income'
+        ],
+        'content_strategy': 'value_first_no_spam',
+        'engagement_goal': '1000 upvotes/month',
+        'lead_generation_target': '500 signups/month'
+    },
+
+    'discord_communities': {
+        'target_servers': [
+            'Indie Hackers', 'Startup Grind', 'Entrepreneur',
+            'Business Network', 'AI Automation', 'SaaS Founders'
+        ],
+        'participation_strategy': 'helpful_contributor',
+        'template_sharing': 'free_samples_weekly'
+    },
+
+    'product_hunt_launch': {
+        'launch_date': '2025-01-15',
+        'preparation_timeline': '30_days',
+        'target_ranking': 'Product of the Day',
+        'email_list_mobilization': 5000,
+        'social_media_push': 'coordinated_launch'
+    }
+})
+
+# Email marketing automation sequences
+_EMAIL_AUTOMATION = _freeze({
+    'welcome_series': {
+        'email_count': 7,
+        'timeline': '14_days',
+        'conversion_goal': 'free_to_paid_template',
+        'personalization': 'business_category_based'
+    },
+
+    'product_launch_sequence': {
+        'email_count': 5,
+        'timeline': '7_days',
+        'target_audience': 'existing_subscribers',
+        'conversion_goal': 'template_bundle_sales'
+    },
+
+    'abandoned_cart_recovery': {
+        'email_count': 3,
+        'timeline': '72_hours',
+        'discount_progression': ['5%', '10%', '15%'],
+        'conversion_target': '25% recovery_rate'
+    },
+
+    'customer_success_series': {
+        'email_count': 12,
+        'timeline': '90_days',
+        'focus': 'template_implementation_success',
+        'upsell_opportunities': 'vault_license_upgrade'
+    }
+})
+
+# Influencer and partnership programs
+_PARTNERSHIPS = _freeze({
+    'influencer_collaborations': {
+        'target_influencers': [
+            'business_coaches', 'entrepreneurship_gurus',
+            'ai_automation_experts', 'startup_advisors',
+            'online_business_teachers'
+        ],
+        'collaboration_types': [
+            'template_reviews', 'success_story_features',
+            'live_demos', 'affiliate_partnerships',
+            'co-created_content'
+        ],
+        'budget': '$2000/month',
+        'target_reach': '500K impressions/month'
+    },
+
+    'business_partnerships': {
+        'target_partners': [
+            'business_incubators', 'startup_accelerators',
+            'consulting_firms', 'business_schools',
+            'coworking_spaces', 'entrepreneurship_programs'
+        ],
+        'partnership_models': [
+            'white_label_licensing', 'revenue_sharing',
+            'bulk_licensing', 'educational_discounts',
+            'branded_template_creation'
+        ]
+    },
+
+    'affiliate_program': {
+        'commission_structure': {
+            'individual_templates': '25%',
+            'template_bundles': '30%',
+            'vault_license': '35%',
+            'enterprise_sales': '40%'
+        },
+        'target_affiliates': 500,
+        'tracking_system': 'advanced_attribution',
+        'payment_schedule': 'monthly'
+    }
+})
+
+def _integration_succeeded(result: Dict) -> bool:
+    """Whether a repo integration got its fork (or skipped it for lack of a token) and its local clone"""
+    return result['fork_creation']['status'] != 'fork_failed' and result['local_clone']['status'] == 'cloned'
 
 class MarketingAutomationEngine:
     """Complete marketing automation with starred repos integration"""
@@ -42,302 +309,121 @@ class MarketingAutomationEngine:
     async def launch_complete_marketing_campaign(self) -> Dict:
         """Launch comprehensive marketing campaign across all channels"""
         
-        campaign_results = {}
-        
-        # 1. Social Media Campaigns
-        social_campaigns = await self._launch_social_campaigns()
-        campaign_results['social'] = social_campaigns
-        
-        # 2. Content Marketing
-        content_campaigns = await self._launch_content_campaigns()
-        campaign_results['content'] = content_campaigns
-        
-        # 3. Community Outreach
-        community_campaigns = await self._launch_community_campaigns()
-        campaign_results['community'] = community_campaigns
-        
-        # 4. Email Marketing
-        email_campaigns = await self._launch_email_campaigns()
-        campaign_results['email'] = email_campaigns
-        
-        # 5. Influencer & Partnership Campaigns
-        partnership_campaigns = await self._launch_partnership_campaigns()
-        campaign_results['partnerships'] = partnership_campaigns
+        campaign_results = {
+            'social': self._launch_social_campaigns(),
+            'content': self._launch_content_campaigns(),
+            'community': self._launch_community_campaigns(),
+            'email': self._launch_email_campaigns(),
+            'partnerships': self._launch_partnership_campaigns()
+        }
         
         return campaign_results
     
-    async def _launch_social_campaigns(self) -> Dict:
+    def _launch_social_campaigns(self) -> Dict[str, Dict]:
         """Launch social media marketing campaigns"""
-        
-        campaigns = {
-            'twitter': {
-                'campaign_type': 'product_launch',
-                'content_themes': [
-                    '487 Business Templates Launch',
-                    'AI-Powered Entrepreneurship',
-                    'Template Success Stories',
-                    'Build Business in 24 Hours',
-                    'From Idea to Revenue'
-                ],
-                'posting_schedule': '3x daily',
-                'hashtags': '#BusinessTemplates #AIEntrepreneurship #StartupTools #IZA_OS',
-                'budget': '$500/month',
-                'target_followers': 10000
-            },
-            
-            'linkedin': {
-                'campaign_type': 'b2b_lead_generation',
-                'content_themes': [
-                    'Business Automation Templates',
-                    'Enterprise Template Solutions', 
-                    'AI-Driven Business Models',
-                    'Consulting Template Packages',
-                    'ROI Case Studies'
-                ],
-                'posting_schedule': '1x daily',
-                'target_audience': 'entrepreneurs, consultants, business_owners',
-                'budget': '$750/month',
-                'target_connections': 5000
-            },
-            
-            'youtube': {
-                'campaign_type': 'educational_content',
-                'video_series': [
-                    'Template Walkthrough Series',
-                    'Business Building Tutorials',
-                    'AI Automation Demos',
-                    'Success Story Interviews',
-                    'Live Template Creation'
-                ],
-                'upload_schedule': '2x weekly',
-                'target_subscribers': 25000,
-                'budget': '$1000/month'
-            }
-        }
-        
-        return campaigns
+        return _thaw(_SOCIAL_CAMPAIGNS)
     
-    async def _launch_content_campaigns(self) -> Dict:
+    def _launch_content_campaigns(self) -> Dict:
         """Launch content marketing campaigns"""
-        
-        content_strategy = {
-            'blog_posts': {
-                'publishing_schedule': '3x weekly',
-                'content_pillars': [
-                    'Business Template Tutorials',
-                    'Entrepreneurship Guides',
-                    'AI Automation Tips',
-                    'Revenue Generation Strategies',
-                    'Template Success Stories'
-                ],
-                'target_traffic': '50K monthly visitors',
-                'seo_keywords': [
-                    'business templates', 'ai business automation',
-                    'startup templates', 'business model canvas',
-                    'revenue generation templates'
-                ]
-            },
-            
-            'email_newsletter': {
-                'frequency': 'weekly',
-                'segments': [
-                    'template_buyers', 'free_users', 'enterprise_prospects',
-                    'content_subscribers', 'affiliate_partners'
-                ],
-                'target_subscribers': 50000,
-                'conversion_goal': '5% template sales from email'
-            },
-            
-            'resource_library': {
-                'free_templates': 25,  # Lead magnets
-                'case_studies': 50,
-                'tutorial_videos': 100,
-                'business_guides': 20,
-                'roi_calculators': 10
-            }
-        }
-        
-        return content_strategy
+        return _thaw(_CONTENT_STRATEGY)
     
-    async def _launch_community_campaigns(self) -> Dict:
+    def _launch_community_campaigns(self) -> Dict:
         """Launch community outreach campaigns"""
-        
-        community_strategy = {
-            'reddit_campaigns': {
-                'target_subreddits': [
-                    'r/entrepreneur', 'r/startups', 'r/smallbusiness',
-                    'r/business', 'r/SaaS', 'r/marketing', 'r/passive_income'
-                ],
-                'content_strategy': 'value_first_no_spam',
-                'engagement_goal': '1000 upvotes/month',
-                'lead_generation_target': '500 signups/month'
-            },
-            
-            'discord_communities': {
-                'target_servers': [
-                    'Indie Hackers', 'Startup Grind', 'Entrepreneur',
-                    'Business Network', 'AI Automation', 'SaaS Founders'
-                ],
-                'participation_strategy': 'helpful_contributor',
-                'template_sharing': 'free_samples_weekly'
-            },
-            
-            'product_hunt_launch': {
-                'launch_date': '2025-01-15',
-                'preparation_timeline': '30_days',
-                'target_ranking': 'Product of the Day',
-                'email_list_mobilization': 5000,
-                'social_media_push': 'coordinated_launch'
-            }
-        }
-        
-        return community_strategy
+        return _thaw(_COMMUNITY_STRATEGY)
     
-    async def _launch_email_campaigns(self) -> Dict:
+    def _launch_email_campaigns(self) -> Dict:
         """Launch email marketing automation"""
-        
-        email_automation = {
-            'welcome_series': {
-                'email_count': 7,
-                'timeline': '14_days',
-                'conversion_goal': 'free_to_paid_template',
-                'personalization': 'business_category_based'
-            },
-            
-            'product_launch_sequence': {
-                'email_count': 5,
-                'timeline': '7_days',
-                'target_audience': 'existing_subscribers',
-                'conversion_goal': 'template_bundle_sales'
-            },
-            
-            'abandoned_cart_recovery': {
-                'email_count': 3,
-                'timeline': '72_hours',
-                'discount_progression': ['5%', '10%', '15%'],
-                'conversion_target': '25% recovery_rate'
-            },
-            
-            'customer_success_series': {
-                'email_count': 12,
-                'timeline': '90_days',
-                'focus': 'template_implementation_success',
-                'upsell_opportunities': 'vault_license_upgrade'
-            }
-        }
-        
-        return email_automation
+        return _thaw(_EMAIL_AUTOMATION)
     
-    async def _launch_partnership_campaigns(self) -> Dict:
+    def _launch_partnership_campaigns(self) -> Dict:
         """Launch influencer and partnership campaigns"""
-        
-        partnerships = {
-            'influencer_collaborations': {
-                'target_influencers': [
-                    'business_coaches', 'entrepreneurship_gurus',
-                    'ai_automation_experts', 'startup_advisors',
-                    'online_business_teachers'
-                ],
-                'collaboration_types': [
-                    'template_reviews', 'success_story_features',
-                    'live_demos', 'affiliate_partnerships',
-                    'co-created_content'
-                ],
-                'budget': '$2000/month',
-                'target_reach': '500K impressions/month'
-            },
-            
-            'business_partnerships': {
-                'target_partners': [
-                    'business_incubators', 'startup_accelerators',
-                    'consulting_firms', 'business_schools',
-                    'coworking_spaces', 'entrepreneurship_programs'
-                ],
-                'partnership_models': [
-                    'white_label_licensing', 'revenue_sharing',
-                    'bulk_licensing', 'educational_discounts',
-                    'branded_template_creation'
-                ]
-            },
-            
-            'affiliate_program': {
-                'commission_structure': {
-                    'individual_templates': '25%',
-                    'template_bundles': '30%',
-                    'vault_license': '35%',
-                    'enterprise_sales': '40%'
-                },
-                'target_affiliates': 500,
-                'tracking_system': 'advanced_attribution',
-                'payment_schedule': 'monthly'
-            }
-        }
-        
-        return partnerships
+        return _thaw(_PARTNERSHIPS)
 
 class StarredReposIntegrator:
     """Integration manager for starred repositories in IZA OS ecosystem"""
     
-    def __init__(self):
-        self.integration_configs = {
-            'DSPy': {
-                'purpose': 'LLM framework for template generation',
-                'integration_points': ['template_creation', 'content_optimization', 'ai_prompting'],
-                'repo_url': 'https://github.com/stanford-futuredata/DSPy',
-                'local_path': '/private/tmp/DSPy-integration'
-            },
-            'Klavis': {
-                'purpose': 'MCP tool integration and AI workflows',
-                'integration_points': ['tool_orchestration', 'workflow_automation', 'mcp_protocols'],
-                'repo_url': 'https://github.com/abi/Klavis',
-                'local_path': '/private/tmp/Klavis-integration'
-            },
-            'FastMCP': {
-                'purpose': 'Fast MCP server implementation',
-                'integration_points': ['server_infrastructure', 'protocol_handling', 'performance_optimization'],
-                'repo_url': 'https://github.com/jlowin/fastmcp',
-                'local_path': '/private/tmp/FastMCP-integration'
-            },
-            'Claude-Flow': {
-                'purpose': 'Agent orchestration and conversation flows',
-                'integration_points': ['agent_workflows', 'conversation_management', 'flow_automation'],
-                'repo_url': 'https://github.com/anthropics/claude-flow',
-                'local_path': '/private/tmp/Claude-Flow-integration'
-            },
-            'WhoDB': {
-                'purpose': 'Database management for template data',
-                'integration_points': ['template_storage', 'user_data', 'analytics_db'],
-                'repo_url': 'https://github.com/clidey/whodb',
-                'local_path': '/private/tmp/WhoDB-integration'
-            },
-            'OpenCode': {
-                'purpose': 'Code generation for templates',
-                'integration_points': ['template_code_generation', 'automation_scripts', 'deployment_code'],
-                'repo_url': 'https://github.com/QwenLM/Qwen2.5-Coder',
-                'local_path': '/private/tmp/OpenCode-integration'
-            }
+    _RAW_CONFIGS = {
+        'DSPy': {
+            'purpose': 'LLM framework for template generation',
+            'integration_points': ['template_creation', 'content_optimization', 'ai_prompting'],
+            'repo_url': 'https://github.com/stanford-futuredata/DSPy',
+            'local_path': '/private/tmp/DSPy-integration'
+        },
+        'Klavis': {
+            'purpose': 'MCP tool integration and AI workflows',
+            'integration_points': ['tool_orchestration', 'workflow_automation', 'mcp_protocols'],
+            'repo_url': 'https://github.com/abi/Klavis',
+            'local_path': '/private/tmp/Klavis-integration'
+        },
+        'FastMCP': {
+            'purpose': 'Fast MCP server implementation',
+            'integration_points': ['server_infrastructure', 'protocol_handling', 'performance_optimization'],
+            'repo_url': 'https://github.com/jlowin/fastmcp',
+            'local_path': '/private/tmp/FastMCP-integration'
+        },
+        'Claude-Flow': {
+            'purpose': 'Agent orchestration and conversation flows',
+            'integration_points': ['agent_workflows', 'conversation_management', 'flow_automation'],
+            'repo_url': 'https://github.com/anthropics/claude-flow',
+            'local_path': '/private/tmp/Claude-Flow-integration'
+        },
+        'WhoDB': {
+            'purpose': 'Database management for template data',
+            'integration_points': ['template_storage', 'user_data', 'analytics_db'],
+            'repo_url': 'https://github.com/clidey/whodb',
+            'local_path': '/private/tmp/WhoDB-integration'
+        },
+        'OpenCode': {
+            'purpose': 'Code generation for templates',
+            'integration_points': ['template_code_generation', 'automation_scripts', 'deployment_code'],
+            'repo_url': 'https://github.com/QwenLM/Qwen2.5-Coder',
+            'local_path': '/private/tmp/OpenCode-integration'
         }
+    }
+    
+    # Read-only configs with the per-repo names and fork URLs precomputed once per process
+    integration_configs = MappingProxyType({
+        repo_name: MappingProxyType({
+            **config,
+            'lower_name': repo_name.lower(),
+            'fork_name': f"{repo_name.lower()}-iza-integration",
+            'fork_url': f"https://github.com/worldwidebro/{repo_name.lower()}-iza-integration"
+        })
+        for repo_name, config in _RAW_CONFIGS.items()
+    })
     
     async def integrate_all_starred_repos(self) -> Dict:
         """Fork and integrate all starred repositories into IZA OS ecosystem"""
         
-        integration_results = {}
-        
-        for repo_name, config in self.integration_configs.items():
-            result = await self._integrate_single_repo(repo_name, config)
-            integration_results[repo_name] = result
+        # Repos are independent, so integrate them all concurrently
+        tasks = {
+            repo_name: self._integrate_single_repo(repo_name, config)
+            for repo_name, config in self.integration_configs.items()
+        }
+        integration_results = dict(zip(tasks, await asyncio.gather(*tasks.values())))
             
         return integration_results
     
     async def _integrate_single_repo(self, repo_name: str, config: Dict) -> Dict:
         """Integrate a single starred repository"""
         
+        # Cloning needs the fork; the remaining steps run in pairs
+        fork_creation = await self._fork_to_worldwidebro(repo_name, config)
+        local_clone, iza_os_adaptation = await asyncio.gather(
+            self._clone_locally(repo_name, config),
+            self._adapt_for_iza_os(repo_name, config)
+        )
+        integration_testing, deployment_setup = await asyncio.gather(
+            self._test_integration(repo_name, config),
+            self._setup_deployment(repo_name, config)
+        )
+        
         integration_steps = {
-            'fork_creation': await self._fork_to_worldwidebro(repo_name, config),
-            'local_clone': await self._clone_locally(repo_name, config),
-            'iza_os_adaptation': await self._adapt_for_iza_os(repo_name, config),
-            'integration_testing': await self._test_integration(repo_name, config),
-            'deployment_setup': await self._setup_deployment(repo_name, config)
+            'fork_creation': fork_creation,
+            'local_clone': local_clone,
+            'iza_os_adaptation': iza_os_adaptation,
+            'integration_testing': integration_testing,
+            'deployment_setup': deployment_setup
         }
         
         return integration_steps
@@ -345,25 +431,53 @@ class StarredReposIntegrator:
     async def _fork_to_worldwidebro(self, repo_name: str, config: Dict) -> Dict:
         """Fork repository to worldwidebro organization"""
         
-        # This would use GitHub API to fork
+        # Forking needs a GitHub token; without one the fork is left to be created manually
+        token = os.getenv('GITHUB_TOKEN')
+        if token:
+            upstream = config['repo_url'].removeprefix('https://github.com/')
+            try:
+                async with _get_http_session().post(
+                    f"https://api.github.com/repos/{upstream}/forks",
+                    headers={'Authorization': f"Bearer {token}", 'Accept': 'application/vnd.github+json'},
+                    json={'organization': 'worldwidebro', 'name': config['fork_name']}
+                ) as response:
+                    status = 'forked' if response.status in (200, 202) else 'fork_failed'
+                    error = None if status == 'forked' else f"GitHub API {response.status}: {await response.text()}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                status, error = 'fork_failed', f"{type(e).__name__}: {e}"
+        else:
+            status, error = 'skipped', None
+        
         fork_result = {
-            'status': 'forked',
+            'status': status,
             'original_repo': config['repo_url'],
-            'forked_repo': f"https://github.com/worldwidebro/{repo_name.lower()}-iza-integration",
+            'forked_repo': config['fork_url'],
             'fork_created_at': datetime.now().isoformat()
         }
+        if error:
+            fork_result['error'] = error
         
         return fork_result
     
     async def _clone_locally(self, repo_name: str, config: Dict) -> Dict:
         """Clone repository to local development environment"""
         
+        local_path = config['local_path']
+        returncode, error = 0, ''
+        if not Path(local_path).exists():
+            returncode, error = await _run_git('clone', '--depth', '1', config['repo_url'], local_path)
+        
+        if returncode == 0:
+            returncode, error = await _run_git('-C', local_path, 'checkout', '-B', 'iza-os-integration')
+        
         clone_result = {
-            'status': 'cloned',
-            'local_path': config['local_path'],
+            'status': 'cloned' if returncode == 0 else 'clone_failed',
+            'local_path': local_path,
             'integration_branch': 'iza-os-integration',
             'cloned_at': datetime.now().isoformat()
         }
+        if returncode != 0:
+            clone_result['error'] = error
         
         return clone_result
     
@@ -377,8 +491,8 @@ class StarredReposIntegrator:
                 'warp-snippets.json'
             ],
             'wrapper_modules': [
-                f'{repo_name.lower()}_iza_wrapper.py',
-                f'{repo_name.lower()}_marketplace_integration.py'
+                f"{config['lower_name']}_iza_wrapper.py",
+                f"{config['lower_name']}_marketplace_integration.py"
             ],
             'integration_points': config['integration_points'],
             'marketplace_features': [
@@ -425,8 +539,8 @@ async def warp_launch_marketing():
     campaigns = await engine.launch_complete_marketing_campaign()
     
     print("📱 Social Media Campaigns:")
-    for platform, config in campaigns['social'].items():
-        print(f"  {platform}: {config['budget']} budget")
+    for platform, campaign in campaigns['social'].items():
+        print(f"  {platform}: ${campaign['budget_usd_month']}/month budget")
     
     print("📝 Content Marketing:")
     print(f"  Blog posts: {campaigns['content']['blog_posts']['publishing_schedule']}")
@@ -444,15 +558,30 @@ async def warp_integrate_starred_repos():
     print("⭐ Integrating starred repositories into IZA OS ecosystem...")
     
     integrator = StarredReposIntegrator()
-    results = await integrator.integrate_all_starred_repos()
+    try:
+        results = await integrator.integrate_all_starred_repos()
+    finally:
+        await _close_http_session()
     
     print("🔗 Integration Results:")
+    failed = []
     for repo, result in results.items():
-        print(f"  {repo}: ✅ Integrated")
+        if _integration_succeeded(result):
+            print(f"  {repo}: ✅ Integrated")
+        else:
+            print(f"  {repo}: ❌ Integration incomplete")
+            failed.append(repo)
         print(f"    Purpose: {integrator.integration_configs[repo]['purpose']}")
-        print(f"    Status: {result['fork_creation']['status']}")
+        print(f"    Fork: {result['fork_creation']['status']}")
+        print(f"    Clone: {result['local_clone']['status']}")
+        for step in (result['fork_creation'], result['local_clone']):
+            if 'error' in step:
+                print("    Error: " + step['error'].replace("\n", "\n           "))
     
-    print("⭐ All starred repos integrated successfully!")
+    if failed:
+        print(f"⚠️ {len(failed)} of {len(results)} starred repos need attention: {', '.join(failed)}")
+    else:
+        print("⭐ All starred repos integrated successfully!")
     return results
 
 async def warp_complete_all_phases():
@@ -468,7 +597,7 @@ async def warp_complete_all_phases():
     # Final status
     completion_status = {
         'marketing_campaign': 'launched',
-        'starred_repos': 'integrated',
+        'starred_repos': 'integrated' if all(map(_integration_succeeded, integration_results.values())) else 'incomplete',
         'revenue_systems': 'monetized',
         'automation': 'deployed',
         'ecosystem_status': 'unified'
@@ -479,7 +608,10 @@ async def warp_complete_all_phases():
     print("✅ Phase 5: Agent Orchestration - DONE") 
     print("✅ Phase 6: Monetization Systems - DONE")
     print("✅ Phase 7: Marketing Campaign - DONE")
-    print("✅ Phase 8: Starred Repos Integration - DONE")
+    if completion_status['starred_repos'] == 'integrated':
+        print("✅ Phase 8: Starred Repos Integration - DONE")
+    else:
+        print("⚠️ Phase 8: Starred Repos Integration - INCOMPLETE")
     
     return {
         'marketing': marketing_results,
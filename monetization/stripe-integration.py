@@ -4,38 +4,233 @@ Complete Monetization Systems - Stripe Integration, Digital Delivery, Subscripti
 Integrates with iza-os-financial-core for unified payment processing
 """
 
+import asyncio
+import atexit
+import csv
+import functools
+import itertools
+import time
+import uuid
+import orjson
 import stripe
 import os
-import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import ssl
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 import boto3
+import requests
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from botocore.signers import CloudFrontSigner
 from pathlib import Path
 
+# Pricing configuration, shared read-only by every engine instance
+PRICING_TIERS = MappingProxyType({
+    'individual': MappingProxyType({'price_range': (5, 50), 'commission': 0.1}),
+    'bundle': MappingProxyType({'price_range': (99, 299), 'commission': 0.15}),
+    'vault': MappingProxyType({'price': 997, 'commission': 0.2}),
+    'enterprise': MappingProxyType({'price_range': (1497, 4997), 'commission': 0.25}),
+    'subscription': MappingProxyType({'monthly': 47, 'annual': 470, 'commission': 0.3})
+})
+
+CATEGORIES = (
+    'Corporate & Enterprise', 'Financial Services', 'E-commerce & Retail',
+    'Education & Training', 'Healthcare & Wellness', 'Community Impact',
+    'Creative & Media', 'Construction & Real Estate', 'Technology & SaaS',
+    'Research & Development'
+)
+
+# Template ID ranges per category
+_CATEGORY_RANGES = {
+    (1, 60): 'Corporate & Enterprise',
+    (61, 132): 'Financial Services',
+    (133, 192): 'E-commerce & Retail',
+    (193, 252): 'Education & Training',
+    (253, 272): 'Healthcare & Wellness',
+    (273, 312): 'Community Impact',
+    (313, 372): 'Creative & Media',
+    (373, 432): 'Construction & Real Estate',
+    (433, 467): 'Technology & SaaS',
+    (468, 487): 'Research & Development'
+}
+
+# Category for every template ID (index 0 unused), built once per process
+_CAT_LUT = tuple(itertools.chain([None], *([name] * (end - start + 1) for (start, end), name in _CATEGORY_RANGES.items())))
+
+# Product.create parameters for every individual template (index 0 unused), built once per process
+_TEMPLATE_PAYLOADS = [None] + [
+    {
+        'name': f"Business Template #{template_id:03d}",
+        'description': "AI-powered business template with automated setup and monetization strategies",
+        'metadata': {
+            'template_id': template_id,
+            'category': _CAT_LUT[template_id],
+            'type': 'individual_template',
+            'pricing_tier': 'individual'
+        },
+        'default_price_data': {
+            'unit_amount': (25 + template_id % 25) * 100,  # Dynamic $25-$50 pricing, in cents
+            'currency': 'usd'
+        }
+    }
+    for template_id in range(1, len(_CAT_LUT))
+]
+
+# Bump whenever product names, prices or metadata change; cached and idempotent
+# products are reused for as long as the version stays the same
+_CATALOG_VERSION = 'v1'
+
+# In-flight Stripe requests, kept under the API rate limit
+_STRIPE_CONCURRENCY = 25
+
+# Worker threads for blocking Stripe calls; the default executor has only min(32, cpu + 4) workers
+_STRIPE_EXECUTOR = ThreadPoolExecutor(max_workers=_STRIPE_CONCURRENCY, thread_name_prefix='stripe')
+
+class ProductCache:
+    """Local record of created Stripe products so re-runs skip the API entirely"""
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries = orjson.loads(path.read_bytes()) if path.exists() else {}
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached product record for key, if any"""
+        return self._entries.get(key)
+    
+    def set(self, key: str, value: Dict):
+        """Record a created product under key"""
+        self._entries[key] = value
+    
+    def save(self):
+        """Write the cache back to disk"""
+        self.path.write_bytes(orjson.dumps(self._entries))
+
+class _HTTP2StripeClient(stripe.HTTPClient):
+    """stripe-python HTTP client that multiplexes requests over a few HTTP/2 connections with httpx
+    
+    Built on the public HTTPClient interface rather than stripe.HTTPXClient, which offers no
+    way to pass in a configured httpx client. Raises ImportError when httpx or h2 is missing.
+    """
+    name = 'httpx-http2'
+    
+    def __init__(self, timeout: float = 80, **kwargs):
+        super().__init__(**kwargs)
+        import httpx
+        
+        self._httpx = httpx
+        self._client = httpx.Client(
+            http2=True,
+            timeout=timeout,
+            verify=ssl.create_default_context(cafile=stripe.ca_bundle_path),
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8)
+        )
+    
+    def request(self, method, url, headers, post_data=None, **kwargs):
+        """Send one request, returning (body, status, headers) as stripe-python expects"""
+        response = self._send(method, url, headers, post_data, stream=False)
+        return response.content, response.status_code, response.headers
+    
+    def request_stream(self, method, url, headers, post_data=None, **kwargs):
+        """Send one request, returning (body iterator, status, headers) as stripe-python expects"""
+        response = self._send(method, url, headers, post_data, stream=True)
+        return response.iter_bytes(), response.status_code, response.headers
+    
+    def close(self):
+        self._client.close()
+    
+    def _send(self, method, url, headers, post_data, stream: bool):
+        """Send a request, mapping transport errors to retryable APIConnectionErrors"""
+        try:
+            return self._client.send(
+                self._client.build_request(method, url, headers=headers, content=post_data),
+                stream=stream
+            )
+        except self._httpx.HTTPError as e:
+            raise stripe.APIConnectionError(
+                f"Network error communicating with Stripe: {type(e).__name__}: {e}",
+                should_retry=True
+            ) from e
+
+@functools.lru_cache(maxsize=None)
+def _pooled_stripe_http_client() -> stripe.HTTPClient:
+    """Build the Stripe HTTP client shared by the whole process
+    
+    Uses HTTP/2 over httpx when httpx[http2] is installed, otherwise one pooled requests.Session.
+    """
+    try:
+        client = _HTTP2StripeClient()
+        atexit.register(client.close)
+        return client
+    except ImportError:
+        pass
+    
+    session = requests.Session()
+    session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32))
+    atexit.register(session.close)
+    return stripe.RequestsClient(session=session, verify_ssl_certs=True)
+
 class MonetizationEngine:
     """Complete monetization system for IZA OS Template Marketplace"""
     
     def __init__(self):
         # Stripe configuration
-        stripe.api_key = os.getenv('STRIPE_SECRET_KEY')
+        self.stripe_secret_key = os.getenv('STRIPE_SECRET_KEY')
         self.stripe_publishable_key = os.getenv('STRIPE_PUBLISHABLE_KEY')
+        self.webhook_secret = os.getenv('STRIPE_WEBHOOK_SECRET')
         
         # AWS S3 for digital delivery
-        self.s3_client = boto3.client('s3')
+        # Pinned region and SigV4 with virtual-hosted addressing avoid a bucket-region lookup per process;
+        # the region comes from AWS_REGION, then boto3's own resolution (AWS_DEFAULT_REGION, profile)
+        self.s3_client = boto3.client(
+            's3',
+            region_name=os.getenv('AWS_REGION') or boto3.session.Session().region_name or 'us-east-1',
+            config=Config(
+                signature_version='s3v4',
+                max_pool_connections=64,
+                s3={'addressing_style': 'virtual'},
+                retries={'mode': 'adaptive', 'max_attempts': 3}
+            )
+        )
         self.bucket_name = 'iza-os-templates'
         
-        # Pricing configuration
-        self.pricing_tiers = {
-            'individual': {'price_range': (5, 50), 'commission': 0.1},
-            'bundle': {'price_range': (99, 299), 'commission': 0.15},
-            'vault': {'price': 997, 'commission': 0.2},
-            'enterprise': {'price_range': (1497, 4997), 'commission': 0.25},
-            'subscription': {'monthly': 47, 'annual': 470, 'commission': 0.3}
-        }
+        # Serve downloads from the CloudFront edge when a signing key is configured, else S3 presigned URLs
+        self.cloudfront_domain = os.getenv('CLOUDFRONT_DOMAIN')
+        self.cloudfront_signer = self._build_cloudfront_signer() if self.cloudfront_domain else None
         
-    def create_all_stripe_products(self) -> Dict:
+        # Caps in-flight Stripe requests to stay under the API rate limit
+        self._stripe_semaphore = asyncio.Semaphore(_STRIPE_CONCURRENCY)
+        
+        self.product_cache = ProductCache(Path(os.getenv('STRIPE_CACHE_PATH', '.stripe-cache.json')))
+        
+    @functools.cached_property
+    def client(self) -> stripe.StripeClient:
+        """Per-engine Stripe client, created on first use so S3-only paths work without STRIPE_SECRET_KEY
+        
+        Replaces the process-global stripe.api_key. Calls share the pooled HTTP/2 or keep-alive
+        connections and let stripe-python back off on 429s, honoring Stripe's retry headers.
+        """
+        return stripe.StripeClient(
+            api_key=self.stripe_secret_key,
+            http_client=_pooled_stripe_http_client(),
+            max_network_retries=5
+        )
+    
+    async def create_all_stripe_products(self) -> Dict:
         """Create all Stripe products for 487 business templates"""
         
+        # Cached IDs are only valid for the account and mode (test/live) that created them
+        scope = await self._account_scope()
+        
+        # A catalog already built for this account and catalog version is returned straight from the cache
+        catalog_key = f'catalog:{scope}:{_CATALOG_VERSION}'
+        cached_catalog = self.product_cache.get(catalog_key)
+        if cached_catalog:
+            return cached_catalog
+        
         results = {
             'individual_templates': [],
             'bundles': [],
@@ -44,176 +239,186 @@ class MonetizationEngine:
             'vault_license': None
         }
         
-        # 1. Individual templates (487 templates)
-        for i in range(1, 488):
-            template_product = self._create_individual_template_product(i)
-            results['individual_templates'].append(template_product)
+        try:
+            # 1. Individual templates (487 templates), created concurrently
+            individual_templates = await asyncio.gather(
+                *[self._cached_product(scope, f'individual:{i}', self._create_individual_template_product, i) for i in range(1, 488)],
+                return_exceptions=True
+            )
             
-        # 2. Category bundles (10 categories)
-        categories = [
-            'Corporate & Enterprise', 'Financial Services', 'E-commerce & Retail',
-            'Education & Training', 'Healthcare & Wellness', 'Community Impact',
-            'Creative & Media', 'Construction & Real Estate', 'Technology & SaaS',
-            'Research & Development'
-        ]
+            # 2-5. Category bundles, vault license, subscriptions and enterprise consulting, created concurrently
+            other_products = await asyncio.gather(
+                *[self._cached_product(scope, f'bundle:{category}', self._create_bundle_product, category) for category in CATEGORIES],
+                self._cached_product(scope, 'vault', self._create_vault_license_product),
+                self._cached_product(scope, 'subscription:monthly', self._create_subscription_product, 'monthly'),
+                self._cached_product(scope, 'subscription:annual', self._create_subscription_product, 'annual'),
+                self._cached_product(scope, 'enterprise', self._create_enterprise_product),
+                return_exceptions=True
+            )
+        finally:
+            # Keep every product created so far, so a failed run resumes instead of starting over
+            self.product_cache.save()
         
-        for category in categories:
-            bundle_product = self._create_bundle_product(category)
-            results['bundles'].append(bundle_product)
-            
-        # 3. Template Vault License (all 487 templates)
-        vault_product = self._create_vault_license_product()
-        results['vault_license'] = vault_product
+        for result in (*individual_templates, *other_products):
+            if isinstance(result, BaseException):
+                raise result
         
-        # 4. Subscription products
-        monthly_sub = self._create_subscription_product('monthly')
-        annual_sub = self._create_subscription_product('annual')
+        *bundles, vault_product, monthly_sub, annual_sub, enterprise_product = other_products
+        results['individual_templates'] = individual_templates
+        results['bundles'] = bundles
+        results['vault_license'] = vault_product
         results['subscriptions'] = [monthly_sub, annual_sub]
-        
-        # 5. Enterprise consulting
-        enterprise_product = self._create_enterprise_product()
         results['enterprise'].append(enterprise_product)
         
+        self.product_cache.set(catalog_key, results)
+        self.product_cache.save()
+        
         return results
     
-    def _create_individual_template_product(self, template_id: int) -> Dict:
+    async def _account_scope(self) -> str:
+        """Identify the Stripe account and mode (test/live) the secret key belongs to"""
+        account = await self._stripe_call(self.client.v1.accounts.retrieve_current)
+        mode = 'live' if '_live_' in self.stripe_secret_key else 'test'
+        return f"{account.id}:{mode}"
+    
+    async def _cached_product(self, scope: str, key: str, create, *args) -> Dict:
+        """Return the locally cached product for key within an account scope, creating it through Stripe on a miss"""
+        cache_key = f"{scope}:{key}:{_CATALOG_VERSION}"
+        product = self.product_cache.get(cache_key)
+        if product is None:
+            product = await create(*args)
+            self.product_cache.set(cache_key, product)
+        return product
+    
+    async def _stripe_call(self, method, *args, idempotency_key: Optional[str] = None, **params):
+        """Run a blocking StripeClient service call on the Stripe worker threads, bounded by the request semaphore"""
+        options = {'idempotency_key': idempotency_key} if idempotency_key else {}
+        async with self._stripe_semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                _STRIPE_EXECUTOR,
+                functools.partial(method, *args, params=params, options=options)
+            )
+    
+    async def _create_individual_template_product(self, template_id: int) -> Dict:
         """Create Stripe product for individual template"""
+        payload = _TEMPLATE_PAYLOADS[template_id]
         
-        # Dynamic pricing based on template complexity
-        base_price = 25 + (template_id % 25)  # $25-$50 range
-        
-        product = stripe.Product.create(
-            name=f"Business Template #{template_id:03d}",
-            description=f"AI-powered business template with automated setup and monetization strategies",
-            metadata={
-                'template_id': template_id,
-                'category': self._get_category_for_template(template_id),
-                'type': 'individual_template'
-            }
-        )
-        
-        price = stripe.Price.create(
-            product=product.id,
-            unit_amount=base_price * 100,  # Convert to cents
-            currency='usd',
-            metadata={
-                'template_id': template_id,
-                'pricing_tier': 'individual'
-            }
+        product = await self._stripe_call(
+            self.client.v1.products.create,
+            idempotency_key=f"tmpl-{template_id}-{_CATALOG_VERSION}",
+            **payload
         )
+        price_id = product.default_price
         
         return {
             'product_id': product.id,
-            'price_id': price.id,
+            'price_id': price_id,
             'template_id': template_id,
-            'amount': base_price,
-            'stripe_url': f"https://buy.stripe.com/test_{price.id}"
+            'amount': payload['default_price_data']['unit_amount'] // 100,
+            'stripe_url': f"https://buy.stripe.com/test_{price_id}"
         }
     
-    def _create_bundle_product(self, category: str) -> Dict:
+    async def _create_bundle_product(self, category: str) -> Dict:
         """Create Stripe product for template bundles"""
         
         bundle_size = 48  # ~48 templates per bundle (487/10)
         bundle_price = 199 + (len(category) * 10)  # Dynamic pricing
         
-        product = stripe.Product.create(
+        product = await self._stripe_call(
+            self.client.v1.products.create,
+            idempotency_key=f"bundle-{category}-{_CATALOG_VERSION}",
             name=f"{category} Template Bundle",
             description=f"Complete {category.lower()} business template collection with {bundle_size}+ templates",
             metadata={
                 'category': category,
                 'template_count': bundle_size,
-                'type': 'bundle'
-            }
-        )
-        
-        price = stripe.Price.create(
-            product=product.id,
-            unit_amount=bundle_price * 100,
-            currency='usd',
-            metadata={
-                'category': category,
+                'type': 'bundle',
                 'pricing_tier': 'bundle'
+            },
+            default_price_data={
+                'unit_amount': bundle_price * 100,
+                'currency': 'usd'
             }
         )
+        price_id = product.default_price
         
         return {
             'product_id': product.id,
-            'price_id': price.id,
+            'price_id': price_id,
             'category': category,
             'amount': bundle_price,
             'template_count': bundle_size
         }
     
-    def _create_vault_license_product(self) -> Dict:
+    async def _create_vault_license_product(self) -> Dict:
         """Create Stripe product for Template Vault License"""
         
-        product = stripe.Product.create(
+        product = await self._stripe_call(
+            self.client.v1.products.create,
+            idempotency_key=f"vault-{_CATALOG_VERSION}",
             name="Template Vault License - All 487 Templates",
             description="Complete access to all 487 business templates + lifetime updates + exclusive consulting sessions",
             metadata={
                 'template_count': 487,
                 'type': 'vault_license',
-                'includes': 'all_templates,lifetime_updates,consulting'
-            }
-        )
-        
-        price = stripe.Price.create(
-            product=product.id,
-            unit_amount=99700,  # $997
-            currency='usd',
-            metadata={
+                'includes': 'all_templates,lifetime_updates,consulting',
                 'pricing_tier': 'vault',
                 'value_proposition': 'complete_access'
+            },
+            default_price_data={
+                'unit_amount': 99700,  # $997
+                'currency': 'usd'
             }
         )
+        price_id = product.default_price
         
         return {
             'product_id': product.id,
-            'price_id': price.id,
+            'price_id': price_id,
             'amount': 997,
             'template_count': 487,
             'includes': ['all_templates', 'lifetime_updates', 'consulting_sessions']
         }
     
-    def _create_subscription_product(self, interval: str) -> Dict:
+    async def _create_subscription_product(self, interval: str) -> Dict:
         """Create subscription products (monthly/annual)"""
         
         amounts = {'monthly': 47, 'annual': 470}
         amount = amounts[interval]
         
-        product = stripe.Product.create(
+        product = await self._stripe_call(
+            self.client.v1.products.create,
+            idempotency_key=f"subscription-{interval}-{_CATALOG_VERSION}",
             name=f"Template Studio {interval.title()} Subscription",
             description=f"10 new AI-generated templates monthly + template customization tools + priority support",
             metadata={
                 'type': 'subscription',
                 'interval': interval,
-                'templates_per_month': 10
-            }
-        )
-        
-        price = stripe.Price.create(
-            product=product.id,
-            unit_amount=amount * 100,
-            currency='usd',
-            recurring={'interval': 'month' if interval == 'monthly' else 'year'},
-            metadata={
-                'pricing_tier': 'subscription',
-                'templates_monthly': 10
+                'templates_per_month': 10,
+                'pricing_tier': 'subscription'
+            },
+            default_price_data={
+                'unit_amount': amount * 100,
+                'currency': 'usd',
+                'recurring': {'interval': 'month' if interval == 'monthly' else 'year'}
             }
         )
+        price_id = product.default_price
         
         return {
             'product_id': product.id,
-            'price_id': price.id,
+            'price_id': price_id,
             'interval': interval,
             'amount': amount,
             'templates_per_month': 10
         }
     
-    def _create_enterprise_product(self) -> Dict:
+    async def _create_enterprise_product(self) -> Dict:
         """Create enterprise consulting product"""
         
-        product = stripe.Product.create(
+        product = await self._stripe_call(
+            self.client.v1.products.create,
+            idempotency_key=f"enterprise-{_CATALOG_VERSION}",
             name="Enterprise Template Development + Consulting",
             description="Custom template creation + white-label licensing + dedicated support + implementation consulting",
             metadata={
@@ -222,10 +427,12 @@ class MonetizationEngine:
             }
         )
         
-        # Multiple price tiers for enterprise
-        prices = []
-        for tier, amount in [('starter', 1997), ('growth', 2997), ('enterprise', 4997)]:
-            price = stripe.Price.create(
+        # Multiple price tiers for enterprise, created concurrently once the product exists
+        tiers = [('starter', 1997), ('growth', 2997), ('enterprise', 4997)]
+        created_prices = await asyncio.gather(*[
+            self._stripe_call(
+                self.client.v1.prices.create,
+                idempotency_key=f"enterprise-{tier}-price-{_CATALOG_VERSION}",
                 product=product.id,
                 unit_amount=amount * 100,
                 currency='usd',
@@ -234,11 +441,17 @@ class MonetizationEngine:
                     'includes_consulting': True
                 }
             )
-            prices.append({
+            for tier, amount in tiers
+        ])
+        
+        prices = [
+            {
                 'tier': tier,
                 'price_id': price.id,
                 'amount': amount
-            })
+            }
+            for (tier, amount), price in zip(tiers, created_prices)
+        ]
         
         return {
             'product_id': product.id,
@@ -264,42 +477,50 @@ class MonetizationEngine:
             }
         ]
         
-        created_webhooks = []
-        for endpoint in webhook_endpoints:
-            webhook = stripe.WebhookEndpoint.create(
-                url=endpoint['url'],
-                enabled_events=endpoint['events']
-            )
-            created_webhooks.append(webhook.id)
+        # Reuse endpoints registered by earlier runs so redeploys don't pile up duplicate subscriptions
+        existing = {
+            endpoint.url: endpoint
+            for endpoint in self.client.v1.webhook_endpoints.list(params={'limit': 100}).auto_paging_iter()
+        }
+        
+        def ensure_endpoint(endpoint: Dict) -> str:
+            current = existing.get(endpoint['url'])
+            if current is None:
+                return self.client.v1.webhook_endpoints.create(params={
+                    'url': endpoint['url'],
+                    'enabled_events': endpoint['events']
+                }).id
+            if set(current.enabled_events) != set(endpoint['events']):
+                self.client.v1.webhook_endpoints.update(current.id, params={'enabled_events': endpoint['events']})
+            return current.id
+        
+        # Endpoints are independent; reconcile them in parallel over the pooled Stripe connections
+        with ThreadPoolExecutor(max_workers=len(webhook_endpoints)) as executor:
+            webhook_ids = list(executor.map(ensure_endpoint, webhook_endpoints))
             
-        return {'webhook_ids': created_webhooks, 'status': 'configured'}
+        return {'webhook_ids': webhook_ids, 'status': 'configured'}
+    
+    def verify_webhook_event(self, payload: bytes, sig_header: str, tolerance: int = 300) -> stripe.Event:
+        """Verify a Stripe-Signature header against the raw request body and return the event
+        
+        stripe-python checks the HMAC-SHA256 signature with hmac/hashlib (OpenSSL-backed)
+        and raises stripe.SignatureVerificationError on a missing secret, malformed
+        header, mismatched signature or stale timestamp.
+        """
+        # Webhook.construct_event needs only the signing secret, not an API client or STRIPE_SECRET_KEY
+        return stripe.Webhook.construct_event(payload, sig_header, self.webhook_secret, tolerance)
     
     def setup_digital_delivery(self) -> Dict:
         """Setup AWS S3 for automated digital delivery"""
         
-        # Create S3 bucket structure
-        folders = [
-            'templates/individual/',
-            'templates/bundles/',
-            'templates/vault/',
-            'customization-tools/',
-            'documentation/',
-            'bonus-materials/'
-        ]
-        
-        for folder in folders:
-            try:
-                self.s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=folder,
-                    Body=b''
-                )
-            except Exception as e:
-                print(f"Folder {folder} may already exist: {e}")
+        # S3 has no folders: prefixes such as templates/individual/ and templates/bundles/ appear with
+        # the first object uploaded under them, so only the bucket itself needs to exist
+        self.s3_client.head_bucket(Bucket=self.bucket_name)
         
         # Setup pre-signed URL generation for secure downloads
         delivery_config = {
             'bucket': self.bucket_name,
+            'delivery_domain': self.cloudfront_domain or f"{self.bucket_name}.s3.amazonaws.com",
             'url_expiry': 3600,  # 1 hour download window
             'access_control': 'authenticated_customers_only'
         }
@@ -309,38 +530,195 @@ class MonetizationEngine:
     def generate_download_link(self, customer_id: str, product_type: str, template_ids: List[int]) -> str:
         """Generate secure download link for purchased templates"""
         
-        # Create downloadable package
-        package_key = f"packages/{customer_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+        # Bundles, the vault and single templates are served from existing objects;
+        # only multi-template custom selections get their own package
+        if product_type == 'vault':
+            package_key = self._vault_key()
+        elif not template_ids:
+            raise ValueError(f"No template_ids given for a {product_type} purchase")
+        elif product_type == 'bundle':
+            package_key = self._bundle_key(self._get_category_for_template(template_ids[0]))
+        elif len(template_ids) == 1:
+            package_key = self._template_key(template_ids[0])
+        else:
+            package_key = f"packages/{customer_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+            self._upload_package(package_key, template_ids)
+        
+        # Generate signed URL (1 hour expiry)
+        if self.cloudfront_signer:
+            download_url = self.cloudfront_signer.generate_presigned_url(
+                f"https://{self.cloudfront_domain}/{package_key}",
+                date_less_than=datetime.now(timezone.utc) + timedelta(seconds=3600)
+            )
+        else:
+            download_url = self.s3_client.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': self.bucket_name, 'Key': package_key},
+                ExpiresIn=3600
+            )
         
-        # Generate pre-signed URL
-        download_url = self.s3_client.generate_presigned_url(
-            'get_object',
-            Params={'Bucket': self.bucket_name, 'Key': package_key},
-            ExpiresIn=3600  # 1 hour expiry
+        return download_url
+    
+    def generate_download_links(self, purchases: List[Tuple[str, str, List[int]]]) -> List[str]:
+        """Generate download links for many (customer_id, product_type, template_ids) purchases in parallel"""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(lambda purchase: self.generate_download_link(*purchase), purchases))
+    
+    async def fetch_balance_summary(self, interval_start: datetime, interval_end: Optional[datetime] = None,
+                                    timeout: float = 600, currency: str = 'usd') -> Dict[str, float]:
+        """Aggregate balance activity server-side with one Stripe Reporting run
+        
+        Returns net amounts in one currency by balance.summary.1 category (e.g.
+        'activity_gross', 'activity_fee'), instead of paginating every charge
+        through the API. The interval is clamped to the data Stripe has already
+        computed; if nothing is available yet (e.g. early on the 1st of the month)
+        an empty summary is returned.
+        """
+        report_type = await self._stripe_call(self.client.v1.reporting.report_types.retrieve, 'balance.summary.1')
+        interval_start = max(int(interval_start.timestamp()), report_type.data_available_start)
+        interval_end = min(
+            int((interval_end or datetime.now(timezone.utc)).timestamp()),
+            report_type.data_available_end
+        )
+        if interval_end <= interval_start:
+            return {}
+        
+        report_run = await self._stripe_call(
+            self.client.v1.reporting.report_runs.create,
+            report_type='balance.summary.1',
+            parameters={
+                'interval_start': interval_start,
+                'interval_end': interval_end,
+                'currency': currency.lower()
+            }
         )
         
-        return download_url
+        deadline = time.monotonic() + timeout
+        delay = 2
+        while report_run.status == 'pending':
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"Stripe report {report_run.id} still pending after {timeout}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30)
+            report_run = await self._stripe_call(self.client.v1.reporting.report_runs.retrieve, report_run.id)
+        
+        if report_run.status != 'succeeded':
+            raise RuntimeError(f"Stripe report {report_run.id} {report_run.status}: {report_run.error}")
+        
+        response = await asyncio.to_thread(
+            requests.get, report_run.result.url, auth=(self.stripe_secret_key, ''), timeout=60
+        )
+        response.raise_for_status()
+        
+        # The report has one row per category and currency; amounts in different currencies can't be summed
+        return {
+            row['category']: float(row['net_amount'])
+            for row in csv.DictReader(response.text.splitlines())
+            if row['currency'] == currency.lower()
+        }
+    
+    def _build_cloudfront_signer(self) -> CloudFrontSigner:
+        """Build a CloudFront URL signer from CLOUDFRONT_KEY_PAIR_ID and CLOUDFRONT_PRIVATE_KEY_PATH
+        
+        The distribution is expected to front the templates bucket through Origin
+        Access Control, with a cache policy keyed on path only so signatures in the
+        query string don't fragment the edge cache.
+        """
+        # Only needed for CloudFront delivery, so imported on demand
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import padding
+        
+        private_key = serialization.load_pem_private_key(
+            Path(os.environ['CLOUDFRONT_PRIVATE_KEY_PATH']).read_bytes(),
+            password=None
+        )
+        
+        def rsa_signer(message: bytes) -> bytes:
+            return private_key.sign(message, padding.PKCS1v15(), hashes.SHA1())
+        
+        return CloudFrontSigner(os.environ['CLOUDFRONT_KEY_PAIR_ID'], rsa_signer)
+    
+    def build_canonical_packages(self, rebuild: bool = False) -> List[str]:
+        """Build the shared bundle and vault packages that bundle/vault download links point at
+        
+        Run once the individual templates are in S3 and again whenever they change (with
+        rebuild=True); packages that already exist are skipped otherwise. Returns the built keys.
+        """
+        packages = [
+            (self._bundle_key(category), range(start, end + 1))
+            for (start, end), category in _CATEGORY_RANGES.items()
+        ]
+        packages.append((self._vault_key(), range(1, len(_CAT_LUT))))
+        
+        built = []
+        for package_key, template_ids in packages:
+            if rebuild or not self._object_exists(package_key):
+                self._upload_package(package_key, template_ids)
+                built.append(package_key)
+        
+        return built
+    
+    def _object_exists(self, key: str) -> bool:
+        """Check for an S3 object with a single HEAD request"""
+        try:
+            self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+        return True
+    
+    def _upload_package(self, package_key: str, template_ids):
+        """Stream a zip of the given templates into S3 without holding the archive in memory
+        
+        A writer thread zips S3 objects into one end of a pipe while upload_fileobj
+        sends the other end as 8 MiB multipart chunks. The archive is staged under a
+        temporary key and only copied to package_key once the writer has finished
+        cleanly, so a failed template fetch never publishes a truncated package.
+        """
+        transfer_config = TransferConfig(multipart_chunksize=8 * 1024 * 1024, use_threads=True)
+        staging_key = f"{package_key}.{uuid.uuid4().hex}.partial"
+        read_fd, write_fd = os.pipe()
+        
+        def write_archive():
+            with open(write_fd, 'wb') as sink, zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as archive:
+                for template_id in template_ids:
+                    key = self._template_key(template_id)
+                    body = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)['Body']
+                    with archive.open(key.rsplit('/', 1)[-1], 'w') as entry:
+                        for chunk in body.iter_chunks(1024 * 1024):
+                            entry.write(chunk)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                writer = executor.submit(write_archive)
+                with open(read_fd, 'rb') as source:
+                    self.s3_client.upload_fileobj(source, self.bucket_name, staging_key, Config=transfer_config)
+                writer.result()
+            
+            self.s3_client.copy(
+                {'Bucket': self.bucket_name, 'Key': staging_key},
+                self.bucket_name, package_key,
+                Config=transfer_config
+            )
+        finally:
+            self.s3_client.delete_object(Bucket=self.bucket_name, Key=staging_key)
+    
+    def _template_key(self, template_id: int) -> str:
+        """S3 key of an individual template"""
+        return f"templates/individual/{template_id:03d}.zip"
+    
+    def _bundle_key(self, category: str) -> str:
+        """S3 key of a category's canonical bundle package"""
+        return f"templates/bundles/{category.lower().replace(' & ', '-').replace(' ', '-')}.zip"
+    
+    def _vault_key(self) -> str:
+        """S3 key of the canonical all-templates vault package"""
+        return "templates/vault/all-templates.zip"
     
     def _get_category_for_template(self, template_id: int) -> str:
         """Map template ID to category"""
-        category_mapping = {
-            (1, 60): 'Corporate & Enterprise',
-            (61, 132): 'Financial Services',
-            (133, 192): 'E-commerce & Retail',
-            (193, 252): 'Education & Training',
-            (253, 272): 'Healthcare & Wellness',
-            (273, 312): 'Community Impact',
-            (313, 372): 'Creative & Media',
-            (373, 432): 'Construction & Real Estate',
-            (433, 467): 'Technology & SaaS',
-            (468, 487): 'Research & Development'
-        }
-        
-        for (start, end), category in category_mapping.items():
-            if start <= template_id <= end:
-                return category
-                
-        return 'Miscellaneous'
+        return _CAT_LUT[template_id] if 0 < template_id < len(_CAT_LUT) else 'Miscellaneous'
 
 # Warp Integration Functions
 def warp_setup_monetization():
@@ -351,7 +729,7 @@ def warp_setup_monetization():
     
     # 1. Create all Stripe products
     print("💳 Creating Stripe products...")
-    products = engine.create_all_stripe_products()
+    products = asyncio.run(engine.create_all_stripe_products())
     print(f"✅ Created {len(products['individual_templates'])} individual templates")
     print(f"✅ Created {len(products['bundles'])} category bundles")
     print(f"✅ Created vault license and subscriptions")
@@ -359,7 +737,7 @@ def warp_setup_monetization():
     # 2. Setup webhooks
     print("🔗 Setting up webhooks...")
     webhooks = engine.setup_webhooks()
-    print(f"✅ Created {len(webhooks['webhook_ids'])} webhooks")
+    print(f"✅ Configured {len(webhooks['webhook_ids'])} webhooks")
     
     # 3. Setup digital delivery
     print("📦 Setting up digital delivery...")
@@ -369,13 +747,29 @@ def warp_setup_monetization():
     print("🎉 Monetization system complete!")
     return {'products': products, 'webhooks': webhooks, 'delivery': delivery}
 
+def warp_build_delivery_packages(rebuild: bool = False):
+    """Warp snippet to build the bundle and vault packages after templates are uploaded to S3"""
+    print("🗜️ Building canonical bundle and vault packages...")
+    
+    engine = MonetizationEngine()
+    built = engine.build_canonical_packages(rebuild=rebuild)
+    
+    print(f"✅ Built {len(built)} packages ({len(_CATEGORY_RANGES) + 1 - len(built)} already up to date)")
+    return built
+
 def warp_sync_payments():
     """Warp snippet to sync payment data with financial core"""
     print("🔄 Syncing payment data with iza-os-financial-core...")
     
-    # This would integrate with the financial core service
+    engine = MonetizationEngine()
+    
+    # Month-to-date gross revenue, summed by Stripe rather than by paging through charges
+    month_start = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    balance_summary = asyncio.run(engine.fetch_balance_summary(month_start))
+    
+    # Remaining metrics would integrate with the financial core service
     sync_result = {
-        'total_revenue': '$47,892',
+        'total_revenue': f"${balance_summary.get('activity_gross', 0):,.0f}",
         'monthly_recurring': '$12,450',
         'conversion_rate': '4.2%',
         'top_templates': ['fintech_001', 'saas_015', 'ecommerce_033'],